@@ -1,58 +1,431 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from collections import defaultdict
+import heapq
+from bisect import bisect_left, insort
+
+# Graphs smaller than this are colored in pure Python; importing and compiling
+# Numba costs far more than it saves on them.
+NUMBA_MIN_COURSES = 500
+
+np = None  # numpy, imported by _load_csr_kernel together with Numba
+_csr_kernel = None
+_csr_kernel_loaded = False
+
+
+def _insert_sorted(ids, i):
+    """Insert i into the sorted list ids unless already present.
+
+    Returns True if i was inserted.
+    """
+    pos = bisect_left(ids, i)
+    if pos == len(ids) or ids[pos] != i:
+        ids.insert(pos, i)
+        return True
+    return False
+
+
+def _remove_sorted(ids, i):
+    """Remove i from the sorted list ids; raise ValueError if it is missing."""
+    pos = bisect_left(ids, i)
+    if pos == len(ids) or ids[pos] != i:
+        raise ValueError(f"{i!r} is not in the sorted list")
+    del ids[pos]
+
+
+def _lowest_free_slot(forbidden):
+    """Return the lowest slot whose bit is clear in the forbidden mask."""
+    free = ~forbidden
+    return (free & -free).bit_length() - 1
+
+
+def _color_csr(indptr, indices, order, max_slots, dsatur, cap=2):
+    """Greedy coloring of a CSR conflict graph, returning the 1-based slot of each course.
+
+    order lists course ids by decreasing degree. With dsatur set it only
+    breaks saturation ties, otherwise courses are colored in that order.
+    max_slots bounds the highest slot that can be assigned. Compiled with
+    Numba by _load_csr_kernel.
+    """
+    n = order.shape[0]
+    slots = np.full(n, -1, np.int32)
+    slot_counts = np.zeros(max_slots + 1, np.int32)
+    # bit s of used[u] set iff slot s is used by a colored neighbor of u
+    used = np.zeros((n, max_slots // 64 + 1), np.uint64)
+    saturation = np.zeros(n, np.int32)
+    one = np.uint64(1)
+
+    for step in range(n):
+        if dsatur:
+            v = -1
+            best = -1
+            for k in range(n):
+                u = order[k]
+                if slots[u] < 0 and saturation[u] > best:
+                    best = saturation[u]
+                    v = u
+        else:
+            v = order[step]
+
+        s = 1
+        while (used[v, s >> 6] >> np.uint64(s & 63)) & one or slot_counts[s] >= cap:
+            s += 1
+        slots[v] = s
+        slot_counts[s] += 1
+
+        word = s >> 6
+        bit = one << np.uint64(s & 63)
+        for p in range(indptr[v], indptr[v + 1]):
+            u = indices[p]
+            if slots[u] < 0 and not used[u, word] & bit:
+                used[u, word] |= bit
+                saturation[u] += 1
+
+    return slots
+
+
+def _load_csr_kernel():
+    """Import numpy and Numba and compile _color_csr on first use.
+
+    Returns the compiled kernel, or None when Numba is not installed.
+    """
+    global np, _csr_kernel, _csr_kernel_loaded
+    if not _csr_kernel_loaded:
+        _csr_kernel_loaded = True
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:  # Numba is optional, schedule_exams falls back to pure Python
+            return None
+        np = numpy
+        _csr_kernel = njit(cache=True)(_color_csr)
+    return _csr_kernel
 
 
 class ExamScheduler:
     def __init__(self):
-        # Graph where each course is a node, edges mean conflict
-        self.graph = defaultdict(set)
-        self.courses = set()
+        # Graph where each course is a node, edges mean conflict. Courses are
+        # interned to dense ids; adj[i] is the sorted list of ids conflicting with i.
+        self.course_names = []
+        self.name_to_id = {}
+        self.adj = []
+        self._names_sorted = []  # course names in alphabetical order, for display
+        # (-degree, id) for every course in ascending order, i.e. the coloring
+        # order; kept up to date by add_conflict, rebuilt lazily otherwise
+        self._degree_sorted = []
+        self._sort_dirty = False
+        # Last schedule_exams result, reused until the graph changes
+        self._dirty = True
+        self._cached_schedule = None
+        self._cached_grouped = None
+        self._slot_counts = None
+        self._full_mask = 1  # bit s set iff slot s is at capacity; slot 0 is never used
+
+    @property
+    def courses(self):
+        """Set-like view of all course names."""
+        return self.name_to_id.keys()
+
+    @property
+    def sorted_courses(self):
+        """Course names in alphabetical order; do not modify."""
+        return self._names_sorted
+
+    def clear(self):
+        """Remove all courses and conflicts, reusing the existing containers."""
+        self.course_names.clear()
+        self.name_to_id.clear()
+        self.adj.clear()
+        self._names_sorted.clear()
+        self._degree_sorted.clear()
+        self._sort_dirty = False
+        self._dirty = True
+        self._cached_schedule = None
+        self._cached_grouped = None
+        self._slot_counts = None
+        self._full_mask = 1
+
+    def _intern(self, course):
+        """Return the id of a course, adding it if it is new."""
+        i = self.name_to_id.get(course)
+        if i is None:
+            i = len(self.course_names)
+            self.name_to_id[course] = i
+            self.course_names.append(course)
+            self.adj.append([])
+            insort(self._names_sorted, course)
+            # degree 0 and the largest id sort last
+            self._degree_sorted.append((0, i))
+            self._dirty = True
+        return i
 
     def add_course(self, course):
         """Add a course to the scheduler."""
-        self.courses.add(course)
+        self._intern(course)
 
     def remove_course(self, course):
         """Remove a course from the scheduler."""
-        if course in self.courses:
-            self.courses.remove(course)
-            if course in self.graph:
-                del self.graph[course]
-            for neighbors in self.graph.values():
-                neighbors.discard(course)
+        i = self.name_to_id.pop(course, None)
+        if i is None:
+            return
+        _remove_sorted(self._names_sorted, course)
+        # only the course's own neighbors reference it
+        for j in self.adj[i]:
+            _remove_sorted(self.adj[j], i)
+
+        last = len(self.course_names) - 1
+        if i != last:
+            # move the last course into the freed id so ids stay dense
+            moved = self.course_names[last]
+            self.course_names[i] = moved
+            self.name_to_id[moved] = i
+            self.adj[i] = self.adj[last]
+            for j in self.adj[i]:
+                _remove_sorted(self.adj[j], last)
+                _insert_sorted(self.adj[j], i)
+        self.course_names.pop()
+        self.adj.pop()
+        self._sort_dirty = True
+        self._dirty = True
 
     def add_conflict(self, course1, course2):
         """Add a conflict between two courses."""
-        self.graph[course1].add(course2)
-        self.graph[course2].add(course1)
-        self.courses.update([course1, course2])
+        if self._link(self._intern(course1), self._intern(course2)):
+            self._dirty = True
+
+    def add_conflict_incremental(self, course1, course2):
+        """Add a conflict, repairing the cached schedule instead of discarding it.
+
+        Only an endpoint sharing a slot with the other is moved, so this costs
+        O(deg) but may use more slots than a fresh schedule. Results already
+        returned by schedule_exams are left unchanged.
+        """
+        i = self._intern(course1)
+        j = self._intern(course2)
+        if not self._link(i, j) or self._dirty:
+            return
+        if self._cached_schedule[course1] == self._cached_schedule[course2]:
+            # move the endpoint with fewer conflicts, it has more free slots
+            self._reschedule_course(min(i, j, key=lambda k: len(self.adj[k])))
+
+    def _link(self, i, j):
+        """Record a conflict between ids i and j; return True if it is new."""
+        if i == j:
+            # a course never conflicts with itself; it is only added
+            return False
+        if not _insert_sorted(self.adj[i], j):
+            return False
+        _insert_sorted(self.adj[j], i)
+        if not self._sort_dirty:
+            for k in (i, j):
+                degree = len(self.adj[k])
+                _remove_sorted(self._degree_sorted, (1 - degree, k))
+                insort(self._degree_sorted, (-degree, k))
+        return True
+
+    def add_conflicts_bulk(self, conflicts):
+        """Add conflicts from an iterable of course pairs.
+
+        Neighbor ids are appended and each touched adjacency list is sorted
+        and deduplicated once at the end, instead of bisecting per edge.
+        A course paired with itself is added but gets no conflict.
+        """
+        touched = set()
+        for course1, course2 in conflicts:
+            i = self._intern(course1)
+            j = self._intern(course2)
+            if i == j:
+                continue
+            self.adj[i].append(j)
+            self.adj[j].append(i)
+            touched.update((i, j))
+
+        for i in touched:
+            self.adj[i] = sorted(set(self.adj[i]))
+        if touched:
+            self._sort_dirty = True
+            self._dirty = True
+
+    def _degree_order(self):
+        """Return (-degree, id) pairs sorted ascending, re-sorting only if stale."""
+        if self._sort_dirty:
+            self._degree_sorted = sorted((-len(neighbors), i) for i, neighbors in enumerate(self.adj))
+            self._sort_dirty = False
+        return self._degree_sorted
+
+    def _reschedule_course(self, i):
+        """Move course i to the lowest valid slot in the cached schedule.
+
+        The cached schedule and grouping are replaced by updated copies, since
+        callers may still hold the previous ones.
+        """
+        names = self.course_names
+        time_slots = dict(self._cached_schedule)
+        grouped = list(self._cached_grouped)
+        slot_counts = self._slot_counts
+        course = names[i]
+        old_slot = time_slots[course]
+        slot_counts[old_slot] -= 1
+        self._full_mask &= ~(1 << old_slot)
+        grouped[old_slot - 1] = [c for c in grouped[old_slot - 1] if c != course]
+
+        forbidden = self._full_mask
+        for j in self.adj[i]:
+            forbidden |= 1 << time_slots[names[j]]
+        slot = _lowest_free_slot(forbidden)
+        if slot == len(slot_counts):
+            # the new conflict raised the bound the counts were sized for
+            slot_counts.append(0)
+        time_slots[course] = slot
+        slot_counts[slot] += 1
+        if slot_counts[slot] >= 2:
+            self._full_mask |= 1 << slot
+        if slot > len(grouped):
+            grouped.append([course])
+        else:
+            grouped[slot - 1] = list(grouped[slot - 1])
+            insort(grouped[slot - 1], course)
+        self._cached_schedule = time_slots
+        self._cached_grouped = grouped
 
     def schedule_exams(self):
-        """Assigns time slots using greedy graph coloring.
+        """Assigns time slots using DSATUR graph coloring.
+
+        At each step the uncolored course with the most distinct slots among
+        its conflicting neighbors (saturation) is scheduled next, ties broken
+        by number of conflicts (degree). The plain degree order is also tried
+        and used instead when it needs fewer slots.
 
         Constraint: at most two courses can be scheduled in the same time slot,
         provided they do not conflict with each other.
+
+        Returns (time_slots, grouped): the slot of each course, and the
+        courses of each slot sorted by name, with grouped[0] holding slot 1.
+        The result is cached and returned as-is until the graph is modified.
+        """
+        if not self._dirty:
+            return self._cached_schedule, self._cached_grouped
+
+        time_slots, self._slot_counts, self._full_mask = self._color_courses()
+        # slots are filled lowest-first, so 1..max(slot) are all in use
+        grouped = [[] for _ in range(max(time_slots.values(), default=0))]
+        for course, slot in time_slots.items():
+            grouped[slot - 1].append(course)
+        for courses in grouped:
+            courses.sort()
+
+        self._cached_schedule = time_slots
+        self._cached_grouped = grouped
+        self._dirty = False
+        return time_slots, grouped
+
+    def _max_slots(self):
+        """Upper bound on the highest slot the coloring can assign.
+
+        A course is kept out of at most one slot per neighbor plus the full
+        slots, and each full slot holds two of the other n - 1 courses. No
+        slot can exceed n either.
+        """
+        n = len(self.course_names)
+        max_degree = -self._degree_order()[0][0] if n else 0
+        return min(n, max_degree + (n - 1) // 2 + 1)
+
+    def _color_courses(self):
+        """Color the conflict graph with DSATUR and with plain degree order.
+
+        Under the two-courses-per-slot cap DSATUR does not always use fewer
+        slots than the static degree order, so both run and the result with
+        fewer slots is kept, DSATUR on ties.
+
+        Returns the slot of each course, the per-slot counts and the mask of
+        slots at capacity.
         """
         if not self.courses:
-            return {}
-        
-        # Sort courses by number of conflicts (degree)
-        sorted_courses = sorted(self.courses, key=lambda c: len(self.graph[c]), reverse=True)
+            return {}, [0], 1
+        kernel = None
+        if len(self.course_names) >= NUMBA_MIN_COURSES:
+            kernel = _load_csr_kernel()
+
+        results = []
+        for dsatur in (True, False):
+            if kernel is not None:
+                results.append(self._color_courses_csr(kernel, dsatur))
+            else:
+                results.append(self._color_courses_python(dsatur))
+        return min(results, key=lambda result: max(result[0].values()))
+
+    def _color_courses_python(self, dsatur=True):
+        """Pure-Python _color_courses over int bitsets.
+
+        Without dsatur, courses are colored in plain degree order.
+        """
+        # Adjacency and slot sets as int bitmasks over course ids
+        names = self.course_names
+        n = len(names)
+        adj_bits = [0] * n
+        for i, neighbors in enumerate(self.adj):
+            bits = 0
+            for j in neighbors:
+                bits |= 1 << j
+            adj_bits[i] = bits
+        degree = [len(neighbors) for neighbors in self.adj]
+
+        # bit s set iff slot s is used by a colored neighbor of each course
+        used_mask = [0] * n
+        saturation = [0] * n
+        colored = [False] * n
+        slot_counts = [0] * (self._max_slots() + 1)  # number of courses assigned per slot
+        full_mask = 1  # bit s set iff slot s is at capacity; slot 0 is never used
+        # already in heap order since every saturation is 0
+        heap = [(0, neg_degree, i) for neg_degree, i in self._degree_order()]
         time_slots = {}
-        slot_counts = defaultdict(int)  # number of courses assigned per slot
-
-        for course in sorted_courses:
-            # slots already used by conflicting neighbors
-            assigned_slots = {time_slots[neighbor] for neighbor in self.graph[course] if neighbor in time_slots}
-            slot = 1
-            # find the lowest slot that's not used by a neighbor and has capacity (<2)
-            while slot in assigned_slots or slot_counts[slot] >= 2:
-                slot += 1
-            time_slots[course] = slot
-            slot_counts[slot] += 1
 
-        return time_slots
+        while heap:
+            neg_sat, _, i = heapq.heappop(heap)
+            # skip stale entries left behind when a course's saturation grew
+            if colored[i] or -neg_sat != saturation[i]:
+                continue
+
+            # the lowest slot that's not used by a neighbor and has capacity (<2)
+            slot = _lowest_free_slot(used_mask[i] | full_mask)
+            slot_bit = 1 << slot
+            colored[i] = True
+            time_slots[names[i]] = slot
+            slot_counts[slot] += 1
+            if slot_counts[slot] >= 2:
+                full_mask |= slot_bit
+
+            adj = adj_bits[i]
+            while adj:
+                lsb = adj & -adj
+                adj ^= lsb
+                j = lsb.bit_length() - 1
+                if colored[j] or used_mask[j] & slot_bit:
+                    continue
+                used_mask[j] |= slot_bit
+                if dsatur:
+                    saturation[j] += 1
+                    heapq.heappush(heap, (-saturation[j], -degree[j], j))
+
+        return time_slots, slot_counts, full_mask
+
+    def _color_courses_csr(self, kernel, dsatur=True):
+        """Same as _color_courses_python, run by the compiled _color_csr kernel."""
+        names = self.course_names
+        n = len(names)
+        indptr = np.zeros(n + 1, np.int32)
+        np.cumsum([len(neighbors) for neighbors in self.adj], out=indptr[1:])
+        indices = np.array([j for neighbors in self.adj for j in neighbors], np.int32)
+        order = np.array([i for _, i in self._degree_order()], np.int32)
+
+        max_slots = self._max_slots()
+        slots = kernel(indptr, indices, order, max_slots, dsatur)
+        time_slots = dict(zip(names, slots.tolist()))
+        slot_counts = np.bincount(slots, minlength=max_slots + 1).tolist()
+        full_mask = 1
+        for slot, count in enumerate(slot_counts):
+            if count >= 2:
+                full_mask |= 1 << slot
+        return time_slots, slot_counts, full_mask
 
 
 class ExamPlannerUI:
@@ -64,6 +437,9 @@ class ExamPlannerUI:
         
         self.scheduler = ExamScheduler()
         self.schedule_result = {}
+        self.schedule_grouped = []
+        self._displayed_schedule = None  # schedule currently shown in result_text
+        self._status_clear_job = None
         
         # Pre-load example data
         self.load_example_data()
@@ -84,31 +460,57 @@ class ExamPlannerUI:
         self.scheduler.add_course("Chemistry(CT)")
         self.scheduler.add_course("Electronics(CT)")
 
-        # Define conflicts among CSE/IT courses
-        self.scheduler.add_conflict("Maths(CSE/IT)", "Physics(CSE/IT)")
-        self.scheduler.add_conflict("Maths(CSE/IT)", "Basic Electrical Engineering(CSE/IT)")
-        self.scheduler.add_conflict("Basic Electrical Engineering(CSE/IT)", "Physics(CSE/IT)")
-        self.scheduler.add_conflict("English(CSE/IT)", "Maths(CSE/IT)")
-        self.scheduler.add_conflict("Physics(CSE/IT)", "English(CSE/IT)")
-        self.scheduler.add_conflict("Basic Electrical Engineering(CSE/IT)", "English(CSE/IT)")
-
-        # Define conflicts among CT courses
-        self.scheduler.add_conflict("Programming for Problem solving(CT)", "Maths(CT)")
-        self.scheduler.add_conflict("Programming for Problem solving(CT)", "Chemistry(CT)")
-        self.scheduler.add_conflict("Maths(CT)", "Electronics(CT)")
-        self.scheduler.add_conflict("Maths(CT)", "Chemistry(CT)")
-        self.scheduler.add_conflict("Electronics(CT)", "Programming for Problem solving(CT)")
-        self.scheduler.add_conflict("Chemistry(CT)", "Electronics(CT)")
-
-        # Define conflicts between CSE/IT and CT courses
-        self.scheduler.add_conflict("Maths(CT)", "Maths(CSE/IT)")
+        pairs = [
+            # Conflicts among CSE/IT courses
+            ("Maths(CSE/IT)", "Physics(CSE/IT)"),
+            ("Maths(CSE/IT)", "Basic Electrical Engineering(CSE/IT)"),
+            ("Basic Electrical Engineering(CSE/IT)", "Physics(CSE/IT)"),
+            ("English(CSE/IT)", "Maths(CSE/IT)"),
+            ("Physics(CSE/IT)", "English(CSE/IT)"),
+            ("Basic Electrical Engineering(CSE/IT)", "English(CSE/IT)"),
+
+            # Conflicts among CT courses
+            ("Programming for Problem solving(CT)", "Maths(CT)"),
+            ("Programming for Problem solving(CT)", "Chemistry(CT)"),
+            ("Maths(CT)", "Electronics(CT)"),
+            ("Maths(CT)", "Chemistry(CT)"),
+            ("Electronics(CT)", "Programming for Problem solving(CT)"),
+            ("Chemistry(CT)", "Electronics(CT)"),
+
+            # Conflicts between CSE/IT and CT courses
+            ("Maths(CT)", "Maths(CSE/IT)"),
+        ]
+
+        # Unique conflict pairs in listed order, inserted in a single pass
+        conflicts = {}
+        for pair in pairs:
+            conflicts.setdefault(frozenset(pair), pair)
+        self.scheduler.add_conflicts_bulk(conflicts.values())
 
     def setup_ui(self):
         """Setup the UI components."""
+        # Shared widget styles; clam honors custom button colors on every platform
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
+        style.configure("Title.TLabel", font=("Arial", 20, "bold"), background="#74e4a6", foreground="#333")
+        style.configure("Heading.TLabel", font=("Arial", 12, "bold"), background="white", foreground="#333")
+        style.configure("Subheading.TLabel", font=("Arial", 10, "bold"), background="white", foreground="#333")
+        style.configure("Field.TLabel", font=("Arial", 9), background="white")
+        style.configure("Status.TLabel", font=("Arial", 9), background="#f0f0f0", foreground="#333")
+        for name, color in (("Course", "#4B1FEB"), ("Conflict", "#FF9800"), ("Generate", "#2196F3"), ("Reset", "#f44336")):
+            style.configure(f"{name}.TButton", font=("Arial", 9), background=color, foreground="white")
+            style.map(f"{name}.TButton", background=[("active", color)])
+        style.configure("Generate.TButton", font=("Arial", 10, "bold"), padding=(0, 8))
+
         # Title
-        title_label = tk.Label(self.root, text="📚 Exam Planner", font=("Arial", 20, "bold"), bg="#74e4a6", fg="#333")
+        title_label = ttk.Label(self.root, text="📚 Exam Planner", style="Title.TLabel")
         title_label.pack(pady=10)
 
+        # Status bar for success messages, packed before main_frame so it keeps its space
+        self.status_var = tk.StringVar()
+        status_label = ttk.Label(self.root, textvariable=self.status_var, anchor=tk.W, style="Status.TLabel")
+        status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+
         # Main container with two columns
         main_frame = tk.Frame(self.root, bg="#f0f0f0")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -122,23 +524,23 @@ class ExamPlannerUI:
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
 
         # ===== LEFT PANEL =====
-        left_title = tk.Label(left_panel, text="Add Course", font=("Arial", 12, "bold"), bg="white", fg="#333")
+        left_title = ttk.Label(left_panel, text="Add Course", style="Heading.TLabel")
         left_title.pack(pady=5)
 
         # Add course input
         course_frame = tk.Frame(left_panel, bg="white")
         course_frame.pack(padx=10, pady=5, fill=tk.X)
         
-        tk.Label(course_frame, text="Course Name:", bg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        ttk.Label(course_frame, text="Course Name:", style="Field.TLabel").pack(side=tk.LEFT, padx=5)
         self.course_input = tk.Entry(course_frame, width=25)
         self.course_input.pack(side=tk.LEFT, padx=5)
         
-        tk.Button(course_frame, text="Add", command=self.add_course, bg="#4B1FEB", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(course_frame, text="Add", command=self.add_course, style="Course.TButton").pack(side=tk.LEFT, padx=5)
 
-        tk.Button(course_frame, text="Remove", command=self.remove_selected_course, bg="#4B1FEB", fg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(course_frame, text="Remove", command=self.remove_selected_course, style="Course.TButton").pack(side=tk.LEFT, padx=5)
 
         # List of courses
-        courses_title = tk.Label(left_panel, text="Courses:", font=("Arial", 10, "bold"), bg="white", fg="#333")
+        courses_title = ttk.Label(left_panel, text="Courses:", style="Subheading.TLabel")
         courses_title.pack(padx=10, pady=(10, 5))
 
         self.courses_listbox = tk.Listbox(left_panel, height=8, width=40, font=("Arial", 9))
@@ -149,36 +551,36 @@ class ExamPlannerUI:
         self.courses_listbox.config(yscrollcommand=courses_scrollbar.set)
 
         # Add conflict section
-        conflict_title = tk.Label(left_panel, text="Add Conflict", font=("Arial", 12, "bold"), bg="white", fg="#333")
+        conflict_title = ttk.Label(left_panel, text="Add Conflict", style="Heading.TLabel")
         conflict_title.pack(pady=(15, 5))
 
         course1_frame = tk.Frame(left_panel, bg="white")
         course1_frame.pack(padx=10, pady=5, fill=tk.X)
         
-        tk.Label(course1_frame, text="Course 1:", bg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        ttk.Label(course1_frame, text="Course 1:", style="Field.TLabel").pack(side=tk.LEFT, padx=5)
         self.conflict_course1 = tk.Entry(course1_frame, width=25)
         self.conflict_course1.pack(side=tk.LEFT, padx=5)
 
         course2_frame = tk.Frame(left_panel, bg="white")
         course2_frame.pack(padx=10, pady=5, fill=tk.X)
         
-        tk.Label(course2_frame, text="Course 2:", bg="white", font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
+        ttk.Label(course2_frame, text="Course 2:", style="Field.TLabel").pack(side=tk.LEFT, padx=5)
         self.conflict_course2 = tk.Entry(course2_frame, width=25)
         self.conflict_course2.pack(side=tk.LEFT, padx=5)
 
-        add_conflict_btn = tk.Button(left_panel, text="Add Conflict", command=self.add_conflict, bg="#FF9800", fg="white", font=("Arial", 9), width=20)
+        add_conflict_btn = ttk.Button(left_panel, text="Add Conflict", command=self.add_conflict, style="Conflict.TButton", width=20)
         add_conflict_btn.pack(pady=10)
 
         # Generate schedule button
-        generate_btn = tk.Button(left_panel, text="Generate Schedule", command=self.generate_schedule, bg="#2196F3", fg="white", font=("Arial", 10, "bold"), width=25, height=2)
+        generate_btn = ttk.Button(left_panel, text="Generate Schedule", command=self.generate_schedule, style="Generate.TButton", width=25)
         generate_btn.pack(pady=15, padx=10)
 
         # Reset button
-        reset_btn = tk.Button(left_panel, text="Clear All & Reset", command=self.reset, bg="#f44336", fg="white", font=("Arial", 9), width=20)
+        reset_btn = ttk.Button(left_panel, text="Clear All & Reset", command=self.reset, style="Reset.TButton", width=20)
         reset_btn.pack(pady=5, padx=10)
 
         # ===== RIGHT PANEL =====
-        result_title = tk.Label(right_panel, text="Exam Schedule", font=("Arial", 12, "bold"), bg="white", fg="#333")
+        result_title = ttk.Label(right_panel, text="Exam Schedule", style="Heading.TLabel")
         result_title.pack(pady=5)
 
         # Results display
@@ -201,8 +603,10 @@ class ExamPlannerUI:
         
         self.scheduler.add_course(course_name)
         self.course_input.delete(0, tk.END)
-        self.update_courses_list()
-        messagebox.showinfo("Success", f"Course '{course_name}' added successfully.")
+        # insert at the sorted position instead of repopulating the whole list
+        index = bisect_left(self.scheduler.sorted_courses, course_name)
+        self.courses_listbox.insert(index, course_name)
+        self.set_status(f"Course '{course_name}' added successfully.")
 
     def remove_selected_course(self):
         """Remove the selected course from the listbox."""
@@ -213,8 +617,8 @@ class ExamPlannerUI:
     
         course_name = self.courses_listbox.get(selection[0])
         self.scheduler.remove_course(course_name)
-        self.update_courses_list()
-        messagebox.showinfo("Success", f"Course '{course_name}' removed successfully.")
+        self.courses_listbox.delete(selection[0])
+        self.set_status(f"Course '{course_name}' removed successfully.")
 
     def add_conflict(self):
         """Add a conflict between two courses."""
@@ -236,7 +640,19 @@ class ExamPlannerUI:
         self.scheduler.add_conflict(course1, course2)
         self.conflict_course1.delete(0, tk.END)
         self.conflict_course2.delete(0, tk.END)
-        messagebox.showinfo("Success", f"Conflict added between '{course1}' and '{course2}'.")
+        self.set_status(f"Conflict added between '{course1}' and '{course2}'.")
+
+    def set_status(self, message):
+        """Show a message in the status bar and clear it after two seconds."""
+        if self._status_clear_job is not None:
+            self.root.after_cancel(self._status_clear_job)
+        self.status_var.set(message)
+        self._status_clear_job = self.root.after(2000, self.clear_status)
+
+    def clear_status(self):
+        """Clear the status bar."""
+        self._status_clear_job = None
+        self.status_var.set("")
 
     def generate_schedule(self):
         """Generate and display the exam schedule."""
@@ -244,57 +660,58 @@ class ExamPlannerUI:
             messagebox.showwarning("No Data", "Please add courses first.")
             return
 
-        self.schedule_result = self.scheduler.schedule_exams()
+        self.schedule_result, self.schedule_grouped = self.scheduler.schedule_exams()
         self.display_schedule()
 
     def update_courses_list(self):
         """Update the courses listbox."""
         self.courses_listbox.delete(0, tk.END)
-        for course in sorted(self.scheduler.courses):
-            self.courses_listbox.insert(tk.END, course)
+        self.courses_listbox.insert(tk.END, *self.scheduler.sorted_courses)
 
     def display_schedule(self):
         """Display the exam schedule."""
+        # Skip redrawing when this exact schedule is already on screen
+        if self.schedule_result is self._displayed_schedule:
+            return
+        self._displayed_schedule = self.schedule_result
+
         self.result_text.delete(1.0, tk.END)
         
         if not self.schedule_result:
             self.result_text.insert(tk.END, "No schedule generated yet.\n\nClick 'Generate Schedule' to create one.")
             return
 
-        self.result_text.insert(tk.END, "=" * 50 + "\n")
-        self.result_text.insert(tk.END, "EXAM SCHEDULE\n")
-        self.result_text.insert(tk.END, "=" * 50 + "\n\n")
+        # Build the whole text first and insert it in one call
+        parts = ["=" * 50 + "\n", "EXAM SCHEDULE\n", "=" * 50 + "\n\n"]
 
-        # Group by time slot
-        slot_dict = defaultdict(list)
-        for course, slot in self.schedule_result.items():
-            slot_dict[slot].append(course)
+        for slot, courses in enumerate(self.schedule_grouped, 1):
+            parts.append(f"⏰ TIME SLOT {slot}:\n")
+            for course in courses:
+                parts.append(f"   • {course}\n")
+            parts.append("\n")
 
-        for slot in sorted(slot_dict.keys()):
-            self.result_text.insert(tk.END, f"⏰ TIME SLOT {slot}:\n")
-            for course in sorted(slot_dict[slot]):
-                self.result_text.insert(tk.END, f"   • {course}\n")
-            self.result_text.insert(tk.END, "\n")
-
-        self.result_text.insert(tk.END, "=" * 50 + "\n")
-        self.result_text.insert(tk.END, f"Total Time Slots: {len(slot_dict)}\n")
-        self.result_text.insert(tk.END, f"Total Courses: {len(self.schedule_result)}\n")
+        parts.append("=" * 50 + "\n")
+        parts.append(f"Total Time Slots: {len(self.schedule_grouped)}\n")
+        parts.append(f"Total Courses: {len(self.schedule_result)}\n")
+        self.result_text.insert(1.0, "".join(parts))
 
     def display_initial_schedule(self):
         """Display initial schedule from example data."""
-        self.schedule_result = self.scheduler.schedule_exams()
+        self.schedule_result, self.schedule_grouped = self.scheduler.schedule_exams()
         self.display_schedule()
 
     def reset(self):
         """Reset everything."""
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all data and reset?"):
-            self.scheduler = ExamScheduler()
+            self.scheduler.clear()
             self.schedule_result = {}
+            self.schedule_grouped = []
             self.course_input.delete(0, tk.END)
             self.conflict_course1.delete(0, tk.END)
             self.conflict_course2.delete(0, tk.END)
-            self.update_courses_list()
             self.load_example_data()
+            # the listbox is only edited row by row elsewhere, so rebuild it here
+            self.update_courses_list()
             self.display_initial_schedule()
             messagebox.showinfo("Reset", "All data cleared. Example data reloaded.")
 
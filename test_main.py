@@ -0,0 +1,172 @@
+import itertools
+import random
+import unittest
+
+import main
+
+
+def random_graph(rng, n, p):
+    """Return course names C0..C{n-1} and conflict pairs with edge probability p."""
+    names = [f"C{i}" for i in range(n)]
+    edges = [(a, b) for a, b in itertools.combinations(names, 2) if rng.random() < p]
+    return names, edges
+
+
+def random_scheduler(rng, n, p):
+    """Return an ExamScheduler over a random_graph."""
+    names, edges = random_graph(rng, n, p)
+    scheduler = main.ExamScheduler()
+    for course in names:
+        scheduler.add_course(course)
+    for course1, course2 in edges:
+        scheduler.add_conflict(course1, course2)
+    return scheduler
+
+
+def baseline_slot_count(names, edges):
+    """Slots used by the original greedy: static degree order, ties in listed order."""
+    graph = {course: set() for course in names}
+    for course1, course2 in edges:
+        graph[course1].add(course2)
+        graph[course2].add(course1)
+
+    time_slots = {}
+    slot_counts = {}
+    for course in sorted(names, key=lambda c: len(graph[c]), reverse=True):
+        assigned_slots = {time_slots[n] for n in graph[course] if n in time_slots}
+        slot = 1
+        while slot in assigned_slots or slot_counts.get(slot, 0) >= 2:
+            slot += 1
+        time_slots[course] = slot
+        slot_counts[slot] = slot_counts.get(slot, 0) + 1
+    return max(time_slots.values(), default=0)
+
+
+def assert_valid_schedule(test, scheduler, names, edges):
+    """Check every course is scheduled, conflicts are apart and slots hold at most two."""
+    time_slots, grouped = scheduler.schedule_exams()
+    test.assertEqual(set(time_slots), set(names))
+    for course1, course2 in edges:
+        test.assertNotEqual(time_slots[course1], time_slots[course2])
+    test.assertTrue(all(1 <= len(courses) <= 2 for courses in grouped))
+    return len(grouped)
+
+
+class ScheduleQualityTest(unittest.TestCase):
+    def check_not_worse_than_baseline(self, rng, n, p):
+        names, edges = random_graph(rng, n, p)
+        scheduler = main.ExamScheduler()
+        for course in names:
+            scheduler.add_course(course)
+        scheduler.add_conflicts_bulk(edges)
+        slots = assert_valid_schedule(self, scheduler, names, edges)
+        self.assertLessEqual(slots, baseline_slot_count(names, edges))
+
+    def test_small_graphs(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            self.check_not_worse_than_baseline(rng, rng.randint(5, 60), rng.random())
+
+    def test_dense_graphs(self):
+        rng = random.Random(2)
+        for p in (0.5, 0.9):
+            for _ in range(10):
+                self.check_not_worse_than_baseline(rng, 200, p)
+
+
+class DegreeOrderTest(unittest.TestCase):
+    def assert_degree_order(self, scheduler):
+        expected = sorted((-len(neighbors), i) for i, neighbors in enumerate(scheduler.adj))
+        self.assertEqual(scheduler._degree_order(), expected)
+
+    def test_order_matches_full_sort(self):
+        rng = random.Random(5)
+        scheduler = main.ExamScheduler()
+        names = [f"C{i}" for i in range(30)]
+        for step in range(2000):
+            op = rng.random()
+            if op < 0.5:
+                scheduler.add_conflict(rng.choice(names), rng.choice(names))
+            elif op < 0.7:
+                scheduler.add_conflict_incremental(rng.choice(names), rng.choice(names))
+            elif op < 0.8:
+                scheduler.add_conflicts_bulk((rng.choice(names), rng.choice(names)) for _ in range(5))
+            elif op < 0.95:
+                scheduler.remove_course(rng.choice(names))
+            elif op < 0.97:
+                scheduler.clear()
+            else:
+                scheduler.schedule_exams()
+            self.assert_degree_order(scheduler)
+
+    def test_self_conflict_is_ignored(self):
+        scheduler = main.ExamScheduler()
+        scheduler.add_course("b")
+        scheduler.add_conflict("a", "a")
+        self.assert_degree_order(scheduler)
+        self.assertEqual(scheduler.schedule_exams()[0], {"a": 1, "b": 1})
+
+    def test_remove_sorted_rejects_missing_item(self):
+        with self.assertRaises(ValueError):
+            main._remove_sorted([(0, 1), (0, 3)], (0, 2))
+
+
+class IncrementalConflictTest(unittest.TestCase):
+    def test_repair_keeps_schedule_valid(self):
+        rng = random.Random(3)
+        for _ in range(100):
+            names, edges = random_graph(rng, rng.randint(2, 40), rng.random() / 2)
+            scheduler = main.ExamScheduler()
+            for course in names:
+                scheduler.add_course(course)
+            scheduler.add_conflicts_bulk(edges)
+            scheduler.schedule_exams()
+            for _ in range(10):
+                course1, course2 = rng.sample(names, 2)
+                scheduler.add_conflict_incremental(course1, course2)
+                edges.append((course1, course2))
+                assert_valid_schedule(self, scheduler, names, edges)
+
+    def test_repair_leaves_earlier_results_unchanged(self):
+        scheduler = main.ExamScheduler()
+        scheduler.add_conflict("a", "b")
+        scheduler.add_course("c")
+        time_slots, grouped = scheduler.schedule_exams()
+        self.assertEqual(time_slots["a"], time_slots["c"])
+        before = (dict(time_slots), [list(courses) for courses in grouped])
+
+        scheduler.add_conflict_incremental("a", "c")
+        self.assertEqual((time_slots, grouped), before)
+        new_slots, _ = scheduler.schedule_exams()
+        self.assertNotEqual(new_slots["a"], new_slots["c"])
+
+    def test_add_conflict_recomputes(self):
+        names, edges = random_graph(random.Random(4), 30, 0.3)
+        edges.append(("C0", "C29"))
+        scheduler = main.ExamScheduler()
+        for course in names:
+            scheduler.add_course(course)
+        scheduler.add_conflicts_bulk(edges[:-1])
+        scheduler.schedule_exams()
+        scheduler.add_conflict(*edges[-1])
+
+        fresh = main.ExamScheduler()
+        for course in names:
+            fresh.add_course(course)
+        fresh.add_conflicts_bulk(edges)
+        self.assertEqual(scheduler.schedule_exams(), fresh.schedule_exams())
+
+
+class CsrKernelTest(unittest.TestCase):
+    @unittest.skipUnless(main._load_csr_kernel(), "Numba is not installed")
+    def test_kernel_matches_python(self):
+        kernel = main._load_csr_kernel()
+        rng = random.Random(0)
+        for _ in range(200):
+            scheduler = random_scheduler(rng, rng.randint(1, 60), rng.random())
+            for dsatur in (True, False):
+                self.assertEqual(scheduler._color_courses_csr(kernel, dsatur), scheduler._color_courses_python(dsatur))
+
+
+if __name__ == "__main__":
+    unittest.main()